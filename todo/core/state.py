@@ -37,14 +37,15 @@ class TodoState:
         Sets the debug flag and data file path based on CLI arguments
         (if provided) and initializes the logger.
         """
-        if hasattr(self.args, "debug"):
-            self.debug = bool(self.args.debug)
+        self.debug = bool(getattr(self.args, "debug", False))
 
-        if hasattr(self.args, "file") and self.args.file:
-            self.data_file = Path(self.args.file)
+        data_file = getattr(self.args, "file", None)
+        if data_file:
+            self.data_file = Path(data_file)
 
         self.logger = TodoLogger()
-        self.logger.info(f"Using data file: {self.data_file}")
+        if self.debug:
+            self.logger.info(f"Using data file: {self.data_file}")
 
     def uptime(self) -> float:
         """Return the time elapsed since the application started.
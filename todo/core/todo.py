@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-import argparse
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from todo.core.state import TodoState
 from todo.data.storage import TodoStorage, generate_todo_id
 from todo.models.record import TodoRecord
-from datetime import datetime
+from todo.utils.logger import write_line
+
+if TYPE_CHECKING:
+    import argparse
 
 HIGH_COLOR = "\033[91m"  # Red
 MED_COLOR = "\033[93m"  # Yellow
 LOW_COLOR = "\033[92m"  # Green
 RESET_COLOR = "\033[0m"
 
+# Sort rank per priority; anything unknown sorts last.
+_PRIO_RANK = {"High": 1, "Med": 2, "Low": 3}
+
+# Display color per priority; anything unknown renders uncolored.
+_PRIO_COLOR = {"High": HIGH_COLOR, "Med": MED_COLOR, "Low": LOW_COLOR}
+
 
 def run_todo_app(args: argparse.Namespace) -> None:
     """Run the main Todo application workflow.
@@ -29,6 +37,8 @@ def run_todo_app(args: argparse.Namespace) -> None:
     Returns:
         None
     """
+    from pathlib import Path
+
     state = TodoState(args)
     storage = TodoStorage(root=Path("data"))
 
@@ -59,13 +69,16 @@ def handle_add_task(state: TodoState, storage: TodoStorage, args: argparse.Names
     Returns:
         None
     """
+    from datetime import datetime
+    from pathlib import Path
+
     category = args.category
     priority = args.priority
 
     due_date = None
     if args.due:
         try:
-            due_date = datetime.strptime(args.due, "%Y-%m-%d")
+            due_date = datetime.fromisoformat(args.due)
         except ValueError:
             state.logger.warn("Invalid due date format. Use YYYY-MM-DD.")
 
@@ -103,11 +116,11 @@ def _filtered_list(
         state.logger.info("No tasks found.")
         return
 
-    # Determine filtering context
-    show_completed = getattr(args, "completed", False)
-    show_pending = getattr(args, "pending", False)
-    category_filter = getattr(args, "category", None)
-    priority_filter = getattr(args, "priority", None)
+    # Determine filtering context; parse_args always sets these fields.
+    show_completed = args.completed
+    show_pending = args.pending
+    category_filter = args.category
+    priority_filter = args.priority
 
     if show_completed:
         state.logger.info("Listing completed tasks:")
@@ -138,7 +151,10 @@ def _filtered_list(
 
 
 def _sort_todo_list(todos: list[TodoRecord]) -> list[TodoRecord] | None:
-    """Sort a list of todo tasks based on priority and due date.
+    """Sort a list of todo tasks in place based on priority and due date.
+
+    The list is the freshly filtered one from ``_filtered_list``, so sorting
+    in place avoids allocating yet another copy.
 
     Args:
         todos (list[TodoRecord]): List of todo tasks to sort.
@@ -146,18 +162,17 @@ def _sort_todo_list(todos: list[TodoRecord]) -> list[TodoRecord] | None:
     Returns:
         sorted (list[TodoRecord] | None): Sorted list of todo tasks or None if input list is empty.
     """
+    from datetime import datetime
+
     if not todos:
         return
 
-    sorted = todos.copy()
+    # Bind lookups once instead of rebuilding them on every comparison.
+    rank = _PRIO_RANK.get
+    datetime_max = datetime.max
 
-    sorted.sort(
-        key=lambda x: (
-            {"High": 1, "Med": 2, "Low": 3}.get(x.priority or "", 4),
-            x.due_date or datetime.max,
-        )
-    )
-    return sorted
+    todos.sort(key=lambda x: (rank(x.priority or "", 4), x.due_date or datetime_max))
+    return todos
 
 
 def handle_list_tasks(state: TodoState, storage: TodoStorage, args: argparse.Namespace) -> None:
@@ -223,18 +238,10 @@ def _print_todo(todo: TodoRecord, i: int) -> None:
     """
     status = "[X]" if todo.completed else "[ ]"
     cat_str = f" [{', '.join(todo.category)}]" if todo.category else ""
-    due_str = f" (Due: {todo.due_date.strftime('%Y-%m-%d')})" if todo.due_date else ""
-
-    priority_color = (
-        HIGH_COLOR
-        if todo.priority == "High"
-        else MED_COLOR
-        if todo.priority == "Med"
-        else LOW_COLOR
-        if todo.priority == "Low"
-        else RESET_COLOR
-    )
+    due_str = f" (Due: {todo.due_date.date().isoformat()})" if todo.due_date else ""
+
+    priority_color = _PRIO_COLOR.get(todo.priority, RESET_COLOR)
 
-    print(
+    write_line(
         f"{priority_color}{i}{RESET_COLOR}.{status} {todo.id}: {todo.description or '(no description)'}{cat_str}{due_str}"
     )
@@ -0,0 +1,5 @@
+"""Persistent storage for todo records."""
+
+from .storage import TodoStorage, generate_todo_id
+
+__all__ = ["TodoStorage", "generate_todo_id"]
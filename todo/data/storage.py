@@ -0,0 +1,227 @@
+"""Storage module for the Todo application."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from todo.models.record import TodoRecord
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Optional fast JSON backend; the stdlib json module is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(text: str | bytes) -> list:
+    """Deserialize JSON text with the fastest available backend.
+
+    Args:
+        text (str | bytes): JSON document to parse.
+
+    Returns:
+        list: The decoded payload.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+
+    import json
+
+    return json.loads(text)
+
+
+def _dumps(data: list) -> bytes:
+    """Serialize a payload to compact JSON bytes with the fastest available backend.
+
+    Args:
+        data (list): JSON-serializable payload.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+
+    import json
+
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _build_index(todos: List[TodoRecord]) -> Dict[str, TodoRecord]:
+    """Build an ID-to-record index for constant-time lookups.
+
+    setdefault keeps the first record when IDs collide, matching the
+    first-match behavior of the linear scans this index replaces.
+
+    Args:
+        todos (list[TodoRecord]): Records to index.
+
+    Returns:
+        dict[str, TodoRecord]: Mapping of todo ID to record.
+    """
+    index: Dict[str, TodoRecord] = {}
+    for todo in todos:
+        index.setdefault(todo.id, todo)
+    return index
+
+
+class TodoStorage:
+    """Manages persistence of Todo records on disk.
+
+    Handles reading and writing todo records to a JSON file, including
+    serialization, deserialization, and simple ID management.
+
+    Attributes:
+        root (Path): Root directory for todo data storage.
+        filepath (Path): Full path to the JSON file storing todos.
+    """
+
+    def __init__(self, root: Path, filename: str = "todo.json") -> None:
+        """Initialize a TodoStorage instance.
+
+        Args:
+            root (Path): Directory to store the todo data file.
+            filename (str): JSON filename for todos. Defaults to "todo.json".
+        """
+        self.root = root
+        self.filepath = self._ensure_todo_file(filename)
+        self._cache: Optional[List[TodoRecord]] = None
+        self._index: Dict[str, TodoRecord] = {}
+
+    def _ensure_todo_file(self, filename: str) -> Path:
+        """Ensure that the todo storage file exists.
+
+        Args:
+            filename (str): Name of the JSON file.
+
+        Returns:
+            Path: Absolute path to the storage file.
+        """
+        path = self.root / filename
+        # Fast path: if the file is already there, so is its directory.
+        if path.exists():
+            return path
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path.write_text("[]", encoding="utf-8")
+        return path
+
+    def load_todos(self) -> List[TodoRecord]:
+        """Load all todos from disk into TodoRecord objects.
+
+        The parsed list is cached on the instance, along with an ID index
+        for the by-ID lookups, so repeated calls within a single run parse
+        the file at most once.
+
+        Returns:
+            list[TodoRecord]: A list of deserialized todo records.
+        """
+        if self._cache is not None:
+            return self._cache
+
+        if not self.filepath.exists():
+            self._cache = []
+            return self._cache
+
+        # Read the raw bytes in one go and hand them straight to the parser;
+        # an empty or freshly-initialized file skips the parser entirely.
+        raw = self.filepath.read_bytes()
+        if not raw or raw.strip() == b"[]":
+            self._cache = []
+            return self._cache
+
+        data = _loads(raw)
+        self._cache = [TodoRecord.from_json_dict(item, base_dir=self.root) for item in data]
+        self._index = _build_index(self._cache)
+        return self._cache
+
+    def save_todos(self, todos: List[TodoRecord]) -> None:
+        """Write all todos to disk as JSON.
+
+        Args:
+            todos (list[TodoRecord]): List of todos to serialize and store.
+        """
+        data = [todo.to_json_dict() for todo in todos]
+        self.filepath.write_bytes(_dumps(data))
+        self._cache = todos
+        self._index = _build_index(todos)
+
+    def add_todo(self, todo: TodoRecord) -> None:
+        """Add a new todo to storage and persist it.
+
+        Args:
+            todo (TodoRecord): The todo record to add.
+        """
+        todos = self.load_todos()
+        todos.append(todo)
+        self.save_todos(todos)
+
+    def remove_todo(self, todo_id: str) -> bool:
+        """Remove a todo from storage by ID.
+
+        Args:
+            todo_id (str): Unique ID of the todo to remove.
+
+        Returns:
+            bool: True if the todo was removed, False if not found.
+        """
+        todos = self.load_todos()
+        todo = self._index.pop(todo_id, None)
+        if todo is None:
+            return False
+
+        todos.remove(todo)
+        self.save_todos(todos)
+        return True
+
+    def get_todo(self, todo_id: str) -> Optional[TodoRecord]:
+        """Retrieve a specific todo by ID.
+
+        Args:
+            todo_id (str): Unique ID of the todo.
+
+        Returns:
+            TodoRecord | None: The found todo, or None if not found.
+        """
+        self.load_todos()
+        return self._index.get(todo_id)
+
+    def mark_completed(self, todo_id: str) -> bool:
+        """Mark a todo as completed and update storage.
+
+        Args:
+            todo_id (str): Unique ID of the todo.
+
+        Returns:
+            bool: True if update succeeded, False otherwise.
+        """
+        todos = self.load_todos()
+        todo = self._index.get(todo_id)
+        if todo is None:
+            return False
+
+        if not todo.completed:
+            todo.completed = True
+            self.save_todos(todos)
+        return True
+
+
+def generate_todo_id(prefix: str = "todo") -> str:
+    """Generate a timestamp-based todo ID.
+
+    Args:
+        prefix (str): Optional ID prefix. Defaults to "todo".
+
+    Returns:
+        str: Unique identifier string.
+    """
+    from datetime import datetime
+
+    now = datetime.now()
+    return (
+        f"{prefix}_{now.year:04d}{now.month:02d}{now.day:02d}"
+        f"_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
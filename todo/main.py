@@ -1,24 +1,99 @@
 """Main module for the Todo command-line application."""
 
 import sys as system
-import argparse
+from types import SimpleNamespace
 
 # Local import
-from todo.core.todo import run_todo_app
 from todo.utils.logger import TodoLogger
 
+VERSION = "Todo App 0.1.0"
+
+USAGE = """usage: todo [-h] [-a ADD] [-l] [-c COMPLETE] [-d DELETE] [-p {Low,Med,High}]
+            [--due DUE] [-C CATEGORY] [--completed] [--pending] [-f FILE]
+            [--debug] [--version]
+
+Command-line Todo application
+
+options:
+  -h, --help            show this help message and exit
+  -a, --add ADD         Add a new task (provide description)
+  -l, --list            List all tasks
+  -c, --complete ID     Mark a task as completed by ID
+  -d, --delete ID       Delete a task by ID
+  -p, --priority {Low,Med,High}
+                        Specify the priority for a new task or filter by priority
+  --due DUE             Specify due date (format: YYYY-MM-DD)
+  -C, --category NAME   Filter or assign category
+  --completed           Show only completed tasks
+  --pending             Show only pending tasks
+  -f, --file FILE       Path to storage file
+  --debug               Enable debug mode
+  --version, -v         show version information and exit"""
+
+PRIORITY_CHOICES = ("Low", "Med", "High")
+
+# Option table mapping each flag to its destination attribute and whether it
+# consumes a value from the following argv slot.
+OPTIONS = {
+    "-a": ("add", True),
+    "--add": ("add", True),
+    "-l": ("list", False),
+    "--list": ("list", False),
+    "-c": ("complete", True),
+    "--complete": ("complete", True),
+    "-d": ("delete", True),
+    "--delete": ("delete", True),
+    "-p": ("priority", True),
+    "--priority": ("priority", True),
+    "--due": ("due", True),
+    "-C": ("category", True),
+    "--category": ("category", True),
+    "--completed": ("completed", False),
+    "--pending": ("pending", False),
+    "-f": ("file", True),
+    "--file": ("file", True),
+    "--debug": ("debug", False),
+}
+
+# Default value per destination attribute, applied before argv is walked.
+DEFAULTS = {
+    "add": None,
+    "list": False,
+    "complete": None,
+    "delete": None,
+    "priority": None,
+    "due": None,
+    "category": None,
+    "completed": False,
+    "pending": False,
+    "file": "todo.json",
+    "debug": False,
+}
+
+
+def _usage_error(message: str) -> None:
+    """Print a usage error to stderr and exit with status 2.
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    Args:
+        message (str): Description of the argument error.
+    """
+    system.stderr.write(f"todo: error: {message}\n")
+    raise SystemExit(2)
+
+
+def parse_args(argv: list[str] | None = None) -> SimpleNamespace:
     """Parse and return command-line arguments for the Todo application.
 
-    Configures all available command-line options for managing tasks, debugging,
-    and controlling output behavior.
+    Walks ``argv`` once against a flag table instead of building an
+    ``argparse.ArgumentParser`` per invocation, keeping CLI startup cost
+    negligible. The returned namespace exposes the same field names as the
+    previous argparse-based parser, so downstream code is unchanged.
 
     Args:
         argv (list[str] | None): Command-line arguments (usually ``sys.argv[1:]``).
 
     Returns:
-        argparse.Namespace: Parsed command-line arguments containing all user options.
+        SimpleNamespace: Parsed command-line arguments containing all user options.
 
     Options:
         -a, --add TEXT          Add a new task with the given description.
@@ -34,47 +109,61 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         --debug                 Enable debug mode with verbose logging.
         --version               Show application version information and exit.
     """
-    parser = argparse.ArgumentParser(description="Command-line Todo application")
-
-    # Core actions
-    parser.add_argument("-a", "--add", help="Add a new task (provide description)", type=str)
-    parser.add_argument("-l", "--list", action="store_true", help="List all tasks")
-    parser.add_argument("-c", "--complete", type=str, help="Mark a task as completed by ID")
-    parser.add_argument("-d", "--delete", type=str, help="Delete a task by ID")
-
-    # Additional options
-    parser.add_argument(
-        "-p",
-        "--priority",
-        type=str,
-        choices=["Low", "Med", "High"],
-        help="Specify the priority for a new task or filter by priority",
-    )
-
-    parser.add_argument(
-        "--due",
-        type=str,
-        help="Specify due date (format: YYYY-MM-DD)",
-    )
-
-    # Filters and categories
-    parser.add_argument("-C", "--category", type=str, help="Filter or assign category")
-    parser.add_argument("--completed", action="store_true", help="Show only completed tasks")
-    parser.add_argument("--pending", action="store_true", help="Show only pending tasks")
-
-    # Configuration
-    parser.add_argument("-f", "--file", type=str, default="todo.json", help="Path to storage file")
-    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
-    parser.add_argument("--version", "-v", action="version", version="Todo App 0.1.0")
-
-    return parser.parse_args(argv)
-
-
-def validate_args(args: argparse.Namespace) -> None:
+    if argv is None:
+        argv = system.argv[1:]
+
+    args = SimpleNamespace(**DEFAULTS)
+
+    i = 0
+    count = len(argv)
+    while i < count:
+        flag = argv[i]
+
+        # Accept the --flag=value spelling for long options.
+        value = None
+        if flag.startswith("--") and "=" in flag:
+            flag, value = flag.split("=", 1)
+
+        # Short-circuit informational flags before any other work.
+        if flag in ("--version", "-v"):
+            print(VERSION)
+            raise SystemExit(0)
+        if flag in ("-h", "--help"):
+            print(USAGE)
+            raise SystemExit(0)
+
+        option = OPTIONS.get(flag)
+        if option is None:
+            _usage_error(f"unrecognized argument: {argv[i]}")
+
+        dest, takes_value = option
+        if takes_value:
+            if value is None:
+                i += 1
+                # The value must be a real value, not the next flag.
+                if i >= count or argv[i] in OPTIONS or argv[i] in ("-h", "--help", "-v", "--version"):
+                    _usage_error(f"argument {flag}: expected one value")
+                value = argv[i]
+            if dest == "priority" and value not in PRIORITY_CHOICES:
+                _usage_error(
+                    f"argument {flag}: invalid choice: '{value}' "
+                    f"(choose from {', '.join(PRIORITY_CHOICES)})"
+                )
+            setattr(args, dest, value)
+        else:
+            if value is not None:
+                _usage_error(f"argument {flag}: ignored explicit argument '{value}'")
+            setattr(args, dest, True)
+        i += 1
+
+    return args
+
+
+def validate_args(args: SimpleNamespace) -> None:
     """Validate parsed command-line arguments.
 
     Args:
-        args (argparse.Namespace): Parsed command-line arguments.
+        args (SimpleNamespace): Parsed command-line arguments.
     """
     if args.completed and args.pending:
         raise ValueError("Cannot use --completed and --pending filters together.")
@@ -93,6 +182,10 @@ def main(argv: list[str] | None = None) -> int:
         TodoLogger().error(str(error))
         return 1
 
+    # Imported here so --version/--help exits never pay for the app modules
+    # (and their datetime/json/pathlib dependencies).
+    from todo.core.todo import run_todo_app
+
     run_todo_app(args)
     return 0
 
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+if TYPE_CHECKING:
+    from datetime import datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class TodoMetadata:
     """Metadata describing a Todo item.
 
@@ -59,6 +61,8 @@ class TodoMetadata:
         Returns:
             TodoMetadata: The reconstructed metadata object.
         """
+        from datetime import datetime
+
         return cls(
             id=payload["id"],
             created_at=datetime.fromisoformat(payload["created_at"]),
@@ -68,7 +72,7 @@ class TodoMetadata:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoRecord(TodoMetadata):
     """A Todo item with attached file system context.
 
@@ -83,8 +87,6 @@ class TodoRecord(TodoMetadata):
 
     folder: Path = field(default_factory=Path)
     data_file: Optional[Path] = None
-    priority: Optional[str] = None  # "Low", "Med", "High"
-    due_date: Optional[datetime] = None  # stored as datetime object
 
     def to_json_dict(self) -> Dict[str, Any]:
         """Convert the TodoRecord object into a JSON-serializable dictionary.
@@ -92,7 +94,9 @@ class TodoRecord(TodoMetadata):
         Returns:
             dict[str, Any]: Dictionary representation including file paths.
         """
-        data = super().to_json_dict()
+        # Explicit base call: slots=True recreates the class, which breaks
+        # zero-argument super() inside dataclass methods.
+        data = TodoMetadata.to_json_dict(self)
         data["folder"] = str(self.folder)
         data["priority"] = self.priority
         data["due_date"] = self.due_date.isoformat() if self.due_date else None
@@ -111,8 +115,16 @@ class TodoRecord(TodoMetadata):
         Returns:
             TodoRecord: The reconstructed record with resolved folder and data file paths.
         """
-        folder = base_dir / payload.get("folder", "")
-        data_file = folder / "todo.json" if folder.exists() else None
+        from datetime import datetime
+
+        # The path is derived, not probed: building it needs no stat, and
+        # callers that open it will surface a missing folder anyway. Only
+        # prepend base_dir when the stored folder does not already include
+        # it, so a load/save round-trip never compounds path segments.
+        folder = Path(payload.get("folder", ""))
+        if folder != base_dir and base_dir not in folder.parents:
+            folder = base_dir / folder
+        data_file = folder / "todo.json"
 
         due = payload.get("due_date")
         due_date = datetime.fromisoformat(due) if due else None
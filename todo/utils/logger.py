@@ -1,53 +1,91 @@
 """Logger for visualizing and distinguishing message types."""
 
+import atexit
+import sys
+
 INFO_COLOR = "\033[94m"  # Blue
 WARN_COLOR = "\033[93m"  # Yellow
 ERROR_COLOR = "\033[91m"  # Red
 SUCCESS_COLOR = "\033[92m"  # Green
 RESET = "\033[0m"
 
+# Output is accumulated here and written with a single syscall at exit,
+# instead of one write per message through line-buffered print().
+_buffer: list[str] = []
+
+
+def write_line(line: str) -> None:
+    """Queue a line of output for the single flush at interpreter exit.
+
+    Args:
+        line (str): Text to display (without trailing newline).
+    """
+    _buffer.append(line)
+
+
+@atexit.register
+def _flush() -> None:
+    """Write all buffered output to stdout in one call."""
+    if _buffer:
+        sys.stdout.write("\n".join(_buffer) + "\n")
+        sys.stdout.flush()
+        _buffer.clear()
+
 
 class TodoLogger:
     """Lightweight color logger for console output.
 
     Provides simple, colored log messages for CLI feedback. This replaces
     the need for Python’s built-in logging module in small CLI apps.
+    Messages are buffered and written to stdout in a single call at exit.
 
     Methods:
-        info(msg): Print informational message in blue.
-        warn(msg): Print warning message in yellow.
-        error(msg): Print error message in red.
-        success(msg): Print success message in green.
+        info(msg): Queue informational message in blue.
+        warn(msg): Queue warning message in yellow.
+        error(msg): Queue error message in red.
+        success(msg): Queue success message in green.
     """
 
+    _instance = None
+
+    def __new__(cls) -> "TodoLogger":
+        """Return the shared logger instance, creating it on first use.
+
+        The logger is stateless, so every ``TodoLogger()`` call site can
+        share one object instead of allocating a new one.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def info(self, msg: str) -> None:
-        """Print an informational message in blue.
+        """Queue an informational message in blue.
 
         Args:
             msg (str): Message text to display.
         """
-        print(f"[{INFO_COLOR}INFO{RESET}] {msg}")
+        write_line(f"[{INFO_COLOR}INFO{RESET}] {msg}")
 
     def warn(self, msg: str) -> None:
-        """Print a warning message in yellow.
+        """Queue a warning message in yellow.
 
         Args:
             msg (str): Message text to display.
         """
-        print(f"[{WARN_COLOR}WARN{RESET}] {msg}")
+        write_line(f"[{WARN_COLOR}WARN{RESET}] {msg}")
 
     def error(self, msg: str) -> None:
-        """Print an error message in red.
+        """Queue an error message in red.
 
         Args:
             msg (str): Message text to display.
         """
-        print(f"[{ERROR_COLOR}ERROR{RESET}] {msg}")
+        write_line(f"[{ERROR_COLOR}ERROR{RESET}] {msg}")
 
     def success(self, msg: str) -> None:
-        """Print a success message in green.
+        """Queue a success message in green.
 
         Args:
             msg (str): Message text to display.
         """
-        print(f"[{SUCCESS_COLOR}OK{RESET}] {msg}")
+        write_line(f"[{SUCCESS_COLOR}OK{RESET}] {msg}")